@@ -1,13 +1,17 @@
 """
 FastAPI backend for FlashCart Chargeback Intelligence Dashboard.
 """
+import json
 import os
-from typing import Any, Dict, List, Optional
-from fastapi import FastAPI, Query
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import FastAPI, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from data_loader import (
     get_df,
@@ -30,8 +34,13 @@ app.add_middleware(
 
 @app.on_event("startup")
 def startup():
+    # Route eligible whole-frame expressions through numexpr's fused,
+    # L2-tiled evaluator (pandas only enables this when numexpr is
+    # importable; it ships in requirements.txt so production gets it).
+    pd.set_option("compute.use_numexpr", True)
     load_data()
     load_transactions()
+    _compute_metrics.cache_clear()
     print("Data loaded successfully.")
 
 
@@ -42,21 +51,96 @@ def _parse_list(value: Optional[str]) -> Optional[List[str]]:
     return [v.strip() for v in value.split(",") if v.strip()]
 
 
-@app.get("/api/chargebacks")
-def get_chargebacks(
-    start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None),
-    merchant_id: Optional[str] = Query(None),
-    reason_category: Optional[str] = Query(None),
-    payment_method: Optional[str] = Query(None),
-    country: Optional[str] = Query(None),
-    min_amount: Optional[float] = Query(None),
-    max_amount: Optional[float] = Query(None),
-    page: int = Query(1, ge=1),
-    page_size: int = Query(50, ge=1, le=500),
-    sort_by: Optional[str] = Query(None),
-    sort_dir: str = Query("desc"),
-) -> Dict[str, Any]:
+def _parse_list_key(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Like _parse_list, but as a sorted tuple: hashable for the metrics
+    cache and order-insensitive, so \"visa,gopay\" and \"gopay,visa\" share
+    one cache entry."""
+    items = _parse_list(value)
+    if items is None:
+        return None
+    return tuple(sorted(items))
+
+
+def _page_indices(key: np.ndarray, ascending: bool, start: int, end: int) -> np.ndarray:
+    """Positions of rows start:end in sort order of *key*, found by
+    partitioning out the top `end` entries and sorting only those.
+
+    The effective order is (key, original position): ties at the partition
+    boundary are resolved toward lower positions, so consecutive pages are
+    consistent with each other even though each request partitions with its
+    own cutoff.
+    """
+    n = len(key)
+    end = min(end, n)
+    if start >= end:
+        return np.empty(0, dtype=np.intp)
+    if np.issubdtype(key.dtype, np.datetime64):
+        key = key.view("i8")
+    if not ascending:
+        key = -key
+    if end < n:
+        idx = np.argpartition(key, end - 1)[:end]
+        # Re-pick boundary ties deterministically by position.
+        boundary = key[idx].max()
+        strict = idx[key[idx] < boundary]
+        need = end - len(strict)
+        tied = np.nonzero(key == boundary)[0][:need]
+        idx = np.concatenate([strict, tied])
+    else:
+        idx = np.arange(n)
+    return idx[np.lexsort((idx, key[idx]))][start:end]
+
+
+_BREAKDOWN_COLS = ("reason_category", "country", "payment_method", "processor")
+_BREAKDOWN_KEYS = ("category", "country", "payment_method", "processor")
+
+
+def _dimension_breakdowns(filtered: pd.DataFrame) -> List[List[Dict[str, Any]]]:
+    """Count/sum amount per category for all four dimension columns in one
+    fused pass: the categorical codes are raveled into a single combined
+    code (5*4*7*7 = 980 cells at current cardinalities), binned once for
+    counts and once for amount sums, and each dimension's breakdown is a
+    marginal sum over that small cube."""
+    cats = [filtered[c].cat.categories for c in _BREAKDOWN_COLS]
+    sizes = [len(c) for c in cats]
+    flat = np.ravel_multi_index(
+        [filtered[c].cat.codes.to_numpy() for c in _BREAKDOWN_COLS], sizes
+    )
+    ncells = int(np.prod(sizes))
+    counts = np.bincount(flat, minlength=ncells).reshape(sizes)
+    sums = np.bincount(
+        flat, weights=filtered["amount_usd"].to_numpy(), minlength=ncells
+    ).reshape(sizes)
+
+    out = []
+    for axis, (key, cat_index) in enumerate(zip(_BREAKDOWN_KEYS, cats)):
+        other = tuple(a for a in range(len(sizes)) if a != axis)
+        out.append(
+            [
+                {key: cat, "count": int(n), "amount": round(float(a), 2)}
+                for cat, n, a in zip(cat_index, counts.sum(axis=other), sums.sum(axis=other))
+                if n > 0
+            ]
+        )
+    return out
+
+
+def _chargebacks_page(
+    start_date: Optional[str],
+    end_date: Optional[str],
+    merchant_id: Optional[str],
+    reason_category: Optional[str],
+    payment_method: Optional[str],
+    country: Optional[str],
+    min_amount: Optional[float],
+    max_amount: Optional[float],
+    page: int,
+    page_size: int,
+    sort_by: Optional[str],
+    sort_dir: str,
+) -> tuple:
+    """Shared filter/sort/paginate step for the JSON and Arrow endpoints.
+    Returns (page frame ready for serialization, total filtered count)."""
     df = get_df()
     filtered = apply_filters(
         df,
@@ -70,32 +154,123 @@ def get_chargebacks(
         max_amount=max_amount,
     )
 
-    # Sort
+    # Sort + paginate. Only the requested page is needed, so select its
+    # rows with argpartition (O(N) + O(k log k)) rather than fully sorting
+    # the filtered frame just to slice out ~50 rows.
     valid_sort_cols = [
         "date", "merchant_name", "merchant_id", "country",
         "reason_category", "payment_method", "amount_usd", "processor",
     ]
     if sort_by and sort_by in valid_sort_cols:
+        sort_col = sort_by
         ascending = sort_dir.lower() != "desc"
-        filtered = filtered.sort_values(sort_by, ascending=ascending)
     else:
-        filtered = filtered.sort_values("date", ascending=False)
+        sort_col, ascending = "date", False
 
     total = len(filtered)
     start_idx = (page - 1) * page_size
     end_idx = start_idx + page_size
-    page_df = filtered.iloc[start_idx:end_idx]
 
-    records = page_df.assign(date=page_df["date"].astype(str)).to_dict(orient="records")
+    col = filtered[sort_col]
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        key = col.cat.codes.to_numpy()
+    else:
+        key = col.to_numpy()
+    if np.issubdtype(key.dtype, np.number) or np.issubdtype(key.dtype, np.datetime64):
+        page_df = filtered.iloc[_page_indices(key, ascending, start_idx, end_idx)]
+    else:
+        # Plain string column (merchant_name): partial selection has no
+        # cheap ordinal key, fall back to a full sort.
+        page_df = filtered.sort_values(sort_col, ascending=ascending).iloc[start_idx:end_idx]
+
+    return page_df, total
+
+
+def _page_table(page_df: pd.DataFrame) -> pa.Table:
+    """Arrow table for one page, with dates as ISO strings and amounts
+    widened back to float64 so consumers see clean cents, not float32
+    artifacts."""
+    return pa.Table.from_pandas(
+        page_df.assign(
+            date=page_df["date"].dt.strftime("%Y-%m-%d"),
+            amount_usd=page_df["amount_usd"].astype("float64").round(2),
+        ),
+        preserve_index=False,
+    )
+
+
+def _arrow_response(table: pa.Table, metadata: Dict[str, Any]) -> Response:
+    """Serialize a table (plus JSON-encoded scalars in the schema metadata)
+    as a single Arrow IPC stream."""
+    table = table.replace_schema_metadata(
+        {k: json.dumps(v) for k, v in metadata.items()}
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return Response(
+        content=sink.getvalue().to_pybytes(),
+        media_type="application/vnd.apache.arrow.stream",
+    )
 
+
+@app.get("/api/chargebacks")
+def get_chargebacks(
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
+    merchant_id: Optional[str] = Query(None),
+    reason_category: Optional[str] = Query(None),
+    payment_method: Optional[str] = Query(None),
+    country: Optional[str] = Query(None),
+    min_amount: Optional[float] = Query(None),
+    max_amount: Optional[float] = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    sort_by: Optional[str] = Query(None),
+    sort_dir: str = Query("desc"),
+) -> Dict[str, Any]:
+    page_df, total = _chargebacks_page(
+        start_date, end_date, merchant_id, reason_category, payment_method,
+        country, min_amount, max_amount, page, page_size, sort_by, sort_dir,
+    )
+    # Arrow's to_pylist builds the record dicts in C++ rather than boxing
+    # every cell through iterrows/to_dict.
     return {
-        "records": records,
+        "records": _page_table(page_df).to_pylist(),
         "total": total,
         "page": page,
         "page_size": page_size,
     }
 
 
+@app.get("/api/chargebacks.arrow")
+def get_chargebacks_arrow(
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
+    merchant_id: Optional[str] = Query(None),
+    reason_category: Optional[str] = Query(None),
+    payment_method: Optional[str] = Query(None),
+    country: Optional[str] = Query(None),
+    min_amount: Optional[float] = Query(None),
+    max_amount: Optional[float] = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    sort_by: Optional[str] = Query(None),
+    sort_dir: str = Query("desc"),
+) -> Response:
+    """Same page as /api/chargebacks, as a columnar Arrow IPC stream: no
+    per-row dict materialization, no JSON encode, and clients that speak
+    Arrow get typed columns back for free."""
+    page_df, total = _chargebacks_page(
+        start_date, end_date, merchant_id, reason_category, payment_method,
+        country, min_amount, max_amount, page, page_size, sort_by, sort_dir,
+    )
+    return _arrow_response(
+        _page_table(page_df),
+        {"total": total, "page": page, "page_size": page_size},
+    )
+
+
 @app.get("/api/metrics")
 def get_metrics(
     start_date: Optional[str] = Query(None),
@@ -106,6 +281,106 @@ def get_metrics(
     country: Optional[str] = Query(None),
     min_amount: Optional[float] = Query(None),
     max_amount: Optional[float] = Query(None),
+) -> Dict[str, Any]:
+    # Metrics are deterministic in the filter params and the data is
+    # immutable per process, so repeat filter combos (e.g. the default
+    # 30-day dashboard view) are served straight from the cache.
+    return _compute_metrics(
+        start_date,
+        end_date,
+        merchant_id,
+        _parse_list_key(reason_category),
+        _parse_list_key(payment_method),
+        _parse_list_key(country),
+        min_amount,
+        max_amount,
+    )
+
+
+# Breakdown component -> name of its key field in the JSON payload; used to
+# flatten the metrics dict into one tidy Arrow table.
+_METRIC_COMPONENTS = {
+    "by_category": "category",
+    "by_country": "country",
+    "by_payment_method": "payment_method",
+    "by_processor": "processor",
+    "by_day": "date",
+    "top_merchants": "merchant_id",
+}
+
+
+@app.get("/api/metrics.arrow")
+def get_metrics_arrow(
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
+    merchant_id: Optional[str] = Query(None),
+    reason_category: Optional[str] = Query(None),
+    payment_method: Optional[str] = Query(None),
+    country: Optional[str] = Query(None),
+    min_amount: Optional[float] = Query(None),
+    max_amount: Optional[float] = Query(None),
+) -> Response:
+    """Same metrics as /api/metrics, as one tidy Arrow IPC table.
+
+    Each breakdown row carries its component name and key; fields a
+    component does not have (rate, merchant_name) are null. The four
+    scalar metrics ride along JSON-encoded in the schema metadata.
+    """
+    data = _compute_metrics(
+        start_date,
+        end_date,
+        merchant_id,
+        _parse_list_key(reason_category),
+        _parse_list_key(payment_method),
+        _parse_list_key(country),
+        min_amount,
+        max_amount,
+    )
+    components: List[str] = []
+    keys: List[str] = []
+    counts: List[int] = []
+    amounts: List[float] = []
+    rates: List[Optional[float]] = []
+    names: List[Optional[str]] = []
+    for component, key_field in _METRIC_COMPONENTS.items():
+        for row in data[component]:
+            components.append(component)
+            keys.append(row[key_field])
+            counts.append(row["count"])
+            amounts.append(row["amount"])
+            rates.append(row.get("rate"))
+            names.append(row.get("merchant_name"))
+    table = pa.table(
+        {
+            "component": components,
+            "key": keys,
+            "count": pa.array(counts, type=pa.int64()),
+            "amount": pa.array(amounts, type=pa.float64()),
+            "rate": pa.array(rates, type=pa.float64()),
+            "merchant_name": pa.array(names, type=pa.string()),
+        }
+    )
+    return _arrow_response(
+        table,
+        {
+            "total_chargebacks": data["total_chargebacks"],
+            "total_disputed_amount": data["total_disputed_amount"],
+            "chargeback_rate": data["chargeback_rate"],
+            "trend_pct": data["trend_pct"],
+        },
+    )
+
+
+@lru_cache(maxsize=256)
+def _compute_metrics(
+    start_date: Optional[str],
+    end_date: Optional[str],
+    merchant_id: Optional[str],
+    reason_category: Optional[Tuple[str, ...]],
+    payment_method: Optional[Tuple[str, ...]],
+    country: Optional[Tuple[str, ...]],
+    min_amount: Optional[float],
+    max_amount: Optional[float],
 ) -> Dict[str, Any]:
     df = get_df()
     filtered = apply_filters(
@@ -113,9 +388,9 @@ def get_metrics(
         start_date=start_date,
         end_date=end_date,
         merchant_id=merchant_id,
-        reason_category=_parse_list(reason_category),
-        payment_method=_parse_list(payment_method),
-        country=_parse_list(country),
+        reason_category=reason_category,
+        payment_method=payment_method,
+        country=country,
         min_amount=min_amount,
         max_amount=max_amount,
     )
@@ -128,78 +403,18 @@ def get_metrics(
         merchant_ids=filtered_merchant_ids,
         start_date=start_date,
         end_date=end_date,
-        payment_method=_parse_list(payment_method),
-        country=_parse_list(country),
+        payment_method=payment_method,
+        country=country,
     )
     trend_pct = compute_trend_pct(df, start_date, end_date)
 
-    # By reason
+    # Per-dimension breakdowns (one fused bincount pass + marginals)
     by_reason = []
-    if total_chargebacks > 0:
-        reason_grp = (
-            filtered.groupby("reason_category")
-            .agg(count=("chargeback_id", "count"), amount=("amount_usd", "sum"))
-            .reset_index()
-        )
-        by_reason = [
-            {
-                "category": row["reason_category"],
-                "count": int(row["count"]),
-                "amount": round(float(row["amount"]), 2),
-            }
-            for _, row in reason_grp.iterrows()
-        ]
-
-    # By country
     by_country = []
-    if total_chargebacks > 0:
-        country_grp = (
-            filtered.groupby("country")
-            .agg(count=("chargeback_id", "count"), amount=("amount_usd", "sum"))
-            .reset_index()
-        )
-        by_country = [
-            {
-                "country": row["country"],
-                "count": int(row["count"]),
-                "amount": round(float(row["amount"]), 2),
-            }
-            for _, row in country_grp.iterrows()
-        ]
-
-    # By payment method
     by_payment_method = []
-    if total_chargebacks > 0:
-        pm_grp = (
-            filtered.groupby("payment_method")
-            .agg(count=("chargeback_id", "count"), amount=("amount_usd", "sum"))
-            .reset_index()
-        )
-        by_payment_method = [
-            {
-                "payment_method": row["payment_method"],
-                "count": int(row["count"]),
-                "amount": round(float(row["amount"]), 2),
-            }
-            for _, row in pm_grp.iterrows()
-        ]
-
-    # By processor
     by_processor = []
     if total_chargebacks > 0:
-        proc_grp = (
-            filtered.groupby("processor")
-            .agg(count=("chargeback_id", "count"), amount=("amount_usd", "sum"))
-            .reset_index()
-        )
-        by_processor = [
-            {
-                "processor": row["processor"],
-                "count": int(row["count"]),
-                "amount": round(float(row["amount"]), 2),
-            }
-            for _, row in proc_grp.iterrows()
-        ]
+        by_reason, by_country, by_payment_method, by_processor = _dimension_breakdowns(filtered)
 
     # By date (daily)
     by_date = []
@@ -210,14 +425,9 @@ def get_metrics(
             .reset_index()
             .sort_values("date")
         )
-        by_date = [
-            {
-                "date": str(row["date"]),
-                "count": int(row["count"]),
-                "amount": round(float(row["amount"]), 2),
-            }
-            for _, row in date_grp.iterrows()
-        ]
+        date_grp["date"] = date_grp["date"].dt.strftime("%Y-%m-%d")
+        date_grp["amount"] = date_grp["amount"].astype("float64").round(2)
+        by_date = pa.Table.from_pandas(date_grp, preserve_index=False).to_pylist()
 
     # Top merchants
     top_merchants = []
@@ -229,7 +439,7 @@ def get_metrics(
             .sort_values("count", ascending=False)
             .head(10)
         )
-        for _, row in merch_grp.iterrows():
+        for row in pa.Table.from_pandas(merch_grp, preserve_index=False).to_pylist():
             merch_count = int(row["count"])
             top_merchants.append(
                 {
@@ -242,8 +452,8 @@ def get_metrics(
                         merchant_ids=[row["merchant_id"]],
                         start_date=start_date,
                         end_date=end_date,
-                        payment_method=_parse_list(payment_method),
-                        country=_parse_list(country),
+                        payment_method=payment_method,
+                        country=country,
                     ),
                 }
             )
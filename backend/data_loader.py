@@ -2,35 +2,158 @@
 Loads chargebacks.csv into a pandas DataFrame and provides filtering utilities.
 """
 import os
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-from datetime import date, timedelta
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from datetime import timedelta
 from typing import Optional, List
 
 _df: Optional[pd.DataFrame] = None
 _tx_df: Optional[pd.DataFrame] = None
 
+# Chargebacks per day, precomputed once at load time as a pair of aligned
+# arrays (sorted day keys + int64 counts). The data is immutable for the
+# lifetime of the process, so trend computations reduce to two searchsorted
+# calls and a contiguous slice sum instead of re-scanning the full frame.
+_days: Optional[np.ndarray] = None
+_daily_counts: Optional[np.ndarray] = None
+
+# Lowercased "merchant_id\x01merchant_name" haystack, precomputed once so
+# the merchant search is a single non-regex substring scan per request
+# instead of two case-insensitive regex passes over object columns.
+_merch_search: Optional[pd.Series] = None
+
+# Backing datetime64 array of the (date-sorted) chargebacks frame; lets the
+# date-range filter become a searchsorted + contiguous slice instead of a
+# full-column scan.
+_date_vals: Optional[np.ndarray] = None
+
+# Dense transactions_count sum cube, axes (day, merchant, payment_method,
+# country) using the shared categorical codes. compute_chargeback_rate is
+# called up to 11 times per metrics request; with the cube each call is a
+# sum over a small sub-array instead of a masked scan of the frame.
+_tx_cube: Optional[np.ndarray] = None
+_tx_day0: Optional[pd.Timestamp] = None
+
 CSV_PATH = os.path.join(os.path.dirname(__file__), "data", "chargebacks.csv")
 TX_CSV_PATH = os.path.join(os.path.dirname(__file__), "data", "transactions_daily.csv")
+PARQUET_PATH = os.path.join(os.path.dirname(__file__), "data", "chargebacks.parquet")
+TX_PARQUET_PATH = os.path.join(os.path.dirname(__file__), "data", "transactions_daily.parquet")
+
+_CATEGORICAL_COLS = ("country", "payment_method", "reason_category", "merchant_id", "processor")
+
+
+def _read_csv(path: str, column_types: dict) -> pd.DataFrame:
+    """Read a CSV through Arrow's multi-threaded C++ parser.
+
+    A large block size lets the reader chew through these files in a single
+    pass; explicit column_types avoid a second date-parsing step in pandas.
+    """
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=8 << 20),
+        convert_options=pacsv.ConvertOptions(column_types=column_types),
+    )
+    return table.to_pandas()
+
+
+def _read_table(parquet_path: str, csv_path: str, column_types: dict) -> pd.DataFrame:
+    """Prefer the Parquet twin (mmap + typed columns, no parsing); fall back
+    to the CSV when only that has been generated."""
+    if os.path.exists(parquet_path):
+        return pq.read_table(parquet_path, memory_map=True).to_pandas()
+    return _read_csv(csv_path, column_types)
 
 
 def load_data() -> pd.DataFrame:
-    global _df
+    global _df, _days, _daily_counts, _merch_search, _date_vals
     if _df is None:
-        _df = pd.read_csv(CSV_PATH)
-        # Normalize new schema column names to keep the rest of the code stable
-        _df["date"] = pd.to_datetime(_df["chargeback_date"]).dt.date
+        _df = _read_table(PARQUET_PATH, CSV_PATH, {"chargeback_date": pa.timestamp("s")})
+        # Normalize new schema column names to keep the rest of the code stable.
+        # Keep "date" as datetime64[ns] (midnight-normalized) so date-range
+        # filters stay vectorized int64 compares instead of per-element
+        # Python date comparisons.
+        _df["date"] = _df["chargeback_date"].dt.normalize()
         _df = _df.rename(columns={"category": "reason_category", "amount": "amount_usd"})
+        # Sort by date once so date-range filters reduce to a binary search
+        # plus a contiguous slice; all per-row caches below stay positionally
+        # aligned with this ordering.
+        _df = _df.sort_values("date", kind="stable").reset_index(drop=True)
+        _date_vals = _df["date"].to_numpy()
+        # Dictionary-encode the low-cardinality string columns: isin and
+        # groupby then work on small integer codes instead of hashing
+        # Python strings row by row. The Parquet path delivers these
+        # already-categorical in generator-declaration order (astype is a
+        # no-op then), so force lexicographic category order: code order
+        # must match label order for code-based sorting and breakdowns.
+        for c in _CATEGORICAL_COLS:
+            _df[c] = _df[c].astype("category")
+            cats = _df[c].cat.categories
+            if not cats.is_monotonic_increasing:
+                _df[c] = _df[c].cat.reorder_categories(cats.sort_values())
+        # Amounts are clipped to [8, 450] with 2 decimals at generation
+        # time; float32 keeps full cent precision at half the byte width.
+        _df["amount_usd"] = _df["amount_usd"].astype("float32")
+        daily = _df.groupby("date").size().sort_index()
+        _days = daily.index.to_numpy()
+        _daily_counts = daily.to_numpy()
+        _merch_search = (
+            _df["merchant_id"].astype(str).str.lower()
+            + "\x01"
+            + _df["merchant_name"].str.lower()
+        )
     return _df
 
 
 def load_transactions() -> pd.DataFrame:
-    global _tx_df
+    global _tx_df, _tx_cube, _tx_day0
     if _tx_df is None:
-        _tx_df = pd.read_csv(TX_CSV_PATH, parse_dates=["date"])
-        _tx_df["date"] = pd.to_datetime(_tx_df["date"]).dt.date
+        cb = load_data()
+        # Both load paths already deliver "date" as datetime64; no second
+        # pandas-side conversion needed.
+        _tx_df = _read_table(TX_PARQUET_PATH, TX_CSV_PATH, {"date": pa.timestamp("s")})
+        # Share the chargebacks frame's category dtypes so both frames use
+        # the same code <-> label mapping (transactions are derived from the
+        # chargebacks, so the label sets match).
+        for c in ("merchant_id", "country", "payment_method", "processor"):
+            _tx_df[c] = _tx_df[c].astype(cb[c].dtype)
+
+        _tx_day0 = _tx_df["date"].min()
+        ndays = (_tx_df["date"].max() - _tx_day0).days + 1
+        shape = (
+            ndays,
+            len(_tx_df["merchant_id"].cat.categories),
+            len(_tx_df["payment_method"].cat.categories),
+            len(_tx_df["country"].cat.categories),
+        )
+        _tx_cube = np.zeros(shape, dtype=np.int64)
+        np.add.at(
+            _tx_cube,
+            (
+                (_tx_df["date"] - _tx_day0).dt.days.to_numpy(),
+                _tx_df["merchant_id"].cat.codes.to_numpy(),
+                _tx_df["payment_method"].cat.codes.to_numpy(),
+                _tx_df["country"].cat.codes.to_numpy(),
+            ),
+            _tx_df["transactions_count"].to_numpy(),
+        )
     return _tx_df
 
 
+@lru_cache(maxsize=512)
+def _parse_date(s: str) -> pd.Timestamp:
+    """Parse an ISO date query param once per distinct value.
+
+    Dashboard sessions repeat the same start/end strings request after
+    request; the cache skips even the (C-level) re-parse.
+    """
+    return pd.Timestamp(s)
+
+
 def get_df() -> pd.DataFrame:
     return load_data()
 
@@ -50,41 +173,60 @@ def apply_filters(
     min_amount: Optional[float] = None,
     max_amount: Optional[float] = None,
 ) -> pd.DataFrame:
-    mask = pd.Series([True] * len(df), index=df.index)
-
+    # The frame is date-sorted at load, so the date range is resolved with
+    # two binary searches and one contiguous slice; the remaining predicates
+    # then only touch the rows inside the range.
+    lo, hi = 0, len(df)
     if start_date:
-        from dateutil.parser import parse as parse_date
-        sd = parse_date(start_date).date()
-        mask &= df["date"] >= sd
-
+        lo = int(_date_vals.searchsorted(_parse_date(start_date).to_datetime64(), "left"))
     if end_date:
-        from dateutil.parser import parse as parse_date
-        ed = parse_date(end_date).date()
-        mask &= df["date"] <= ed
+        hi = int(_date_vals.searchsorted(_parse_date(end_date).to_datetime64(), "right"))
+    if lo > 0 or hi < len(df):
+        df = df.iloc[lo:hi]
+
+    # Collect only the active predicates as bare bool ndarrays, then fold
+    # them into one bitmap in place: a single write pass instead of
+    # rewriting a full-length running mask per filter.
+    preds = []
 
     if merchant_id:
-        # Support partial match (search)
-        mask &= (
-            df["merchant_id"].str.contains(merchant_id, case=False, na=False)
-            | df["merchant_name"].str.contains(merchant_id, case=False, na=False)
-        )
+        # Support partial match (search) over id and name via the
+        # precomputed lowercase haystack (sliced to stay aligned with df).
+        needle = merchant_id.lower()
+        haystack = _merch_search.iloc[lo:hi]
+        preds.append(haystack.str.contains(needle, regex=False).to_numpy())
 
     if reason_category:
-        mask &= df["reason_category"].isin(reason_category)
+        preds.append(df["reason_category"].isin(reason_category).to_numpy())
 
     if payment_method:
-        mask &= df["payment_method"].isin(payment_method)
+        preds.append(df["payment_method"].isin(payment_method).to_numpy())
 
     if country:
-        mask &= df["country"].isin(country)
-
-    if min_amount is not None:
-        mask &= df["amount_usd"] >= min_amount
-
-    if max_amount is not None:
-        mask &= df["amount_usd"] <= max_amount
-
-    return df[mask].copy()
+        preds.append(df["country"].isin(country).to_numpy())
+
+    if min_amount is not None or max_amount is not None:
+        amounts = df["amount_usd"].to_numpy()
+        if min_amount is not None:
+            preds.append(amounts >= min_amount)
+        if max_amount is not None:
+            preds.append(amounts <= max_amount)
+
+    if not preds:
+        return df
+
+    # to_numpy() may hand back a read-only view, so let the first combine
+    # allocate the (writable) output and fold the rest into it in place.
+    if len(preds) == 1:
+        mask = preds[0]
+    else:
+        mask = np.logical_and(preds[0], preds[1])
+        for p in preds[2:]:
+            np.logical_and(mask, p, out=mask)
+    # No defensive copy: boolean indexing already yields a fresh frame
+    # (and copy-on-write protects the no-predicate passthrough above);
+    # callers only read from the result.
+    return df[mask]
 
 
 def compute_trend_pct(
@@ -96,23 +238,27 @@ def compute_trend_pct(
     Compare chargeback count in the current period vs the same-length previous period.
     Returns percentage change (positive = worsening).
     """
-    from dateutil.parser import parse as parse_date
-
     if not start_date or not end_date:
-        today = date.today()
+        today = pd.Timestamp.today().normalize()
         ed = today
         sd = today - timedelta(days=29)
     else:
-        sd = parse_date(start_date).date()
-        ed = parse_date(end_date).date()
+        sd = _parse_date(start_date)
+        ed = _parse_date(end_date)
 
     period_len = (ed - sd).days
     prev_sd = sd - timedelta(days=period_len + 1)
     prev_ed = sd - timedelta(days=1)
 
-    current_count = len(df[(df["date"] >= sd) & (df["date"] <= ed)])
-    prev_df = get_df()
-    prev_count = len(prev_df[(prev_df["date"] >= prev_sd) & (prev_df["date"] <= prev_ed)])
+    load_data()
+
+    def _range_count(a: pd.Timestamp, b: pd.Timestamp) -> int:
+        lo = _days.searchsorted(a.to_datetime64(), "left")
+        hi = _days.searchsorted(b.to_datetime64(), "right")
+        return int(_daily_counts[lo:hi].sum())
+
+    current_count = _range_count(sd, ed)
+    prev_count = _range_count(prev_sd, prev_ed)
 
     if prev_count == 0:
         return 0.0
@@ -133,29 +279,36 @@ def compute_chargeback_rate(
     Filters are applied consistently: date range, merchant IDs, payment method, country.
     reason_category and amount range are chargeback-specific and not present in transactions.
     """
-    from dateutil.parser import parse as parse_date
-
     tx = load_transactions()
-    mask = pd.Series([True] * len(tx), index=tx.index)
+    ndays = _tx_cube.shape[0]
 
+    lo, hi = 0, ndays
     if start_date:
-        sd = parse_date(start_date).date()
-        mask &= tx["date"] >= sd
-
+        lo = max(0, (_parse_date(start_date) - _tx_day0).days)
     if end_date:
-        ed = parse_date(end_date).date()
-        mask &= tx["date"] <= ed
+        hi = min(ndays, (_parse_date(end_date) - _tx_day0).days + 1)
+    if hi <= lo:
+        return 0.0
+
+    sub = _tx_cube[lo:hi]
 
+    # get_indexer yields one cube index per query element, so duplicated
+    # filter values (e.g. payment_method=visa,visa) would gather — and
+    # count — the same slice twice; np.unique keeps the gather idempotent
+    # like the isin mask it replaced.
     if merchant_ids:
-        mask &= tx["merchant_id"].isin(merchant_ids)
+        codes = tx["merchant_id"].cat.categories.get_indexer(list(merchant_ids))
+        sub = sub[:, np.unique(codes[codes >= 0])]
 
     if payment_method:
-        mask &= tx["payment_method"].isin(payment_method)
+        codes = tx["payment_method"].cat.categories.get_indexer(list(payment_method))
+        sub = sub[:, :, np.unique(codes[codes >= 0])]
 
     if country:
-        mask &= tx["country"].isin(country)
+        codes = tx["country"].cat.categories.get_indexer(list(country))
+        sub = sub[..., np.unique(codes[codes >= 0])]
 
-    total_transactions = int(tx.loc[mask, "transactions_count"].sum())
+    total_transactions = int(sub.sum())
 
     if total_transactions == 0 or chargeback_count == 0:
         return 0.0
@@ -3,13 +3,11 @@ One-shot data generation script for FlashCart chargeback data.
 Run this to produce chargebacks.csv (900+ records).
 """
 import uuid
-import random
 import numpy as np
 import pandas as pd
 from datetime import date, timedelta
 
-random.seed(42)
-np.random.seed(42)
+rng = np.random.default_rng(42)
 
 # --- Date setup ---
 today = date.today()
@@ -21,10 +19,6 @@ middle_start = start_date + timedelta(days=30)
 middle_end = start_date + timedelta(days=59)
 recent_start = start_date + timedelta(days=60)
 
-def random_date_in_range(d_start: date, d_end: date) -> date:
-    delta = (d_end - d_start).days
-    return d_start + timedelta(days=random.randint(0, delta))
-
 # --- Distributions ---
 COUNTRIES = ["ID", "PH", "TH", "VN"]
 COUNTRY_WEIGHTS = [0.40, 0.25, 0.20, 0.15]
@@ -69,13 +63,11 @@ MERCHANT_NAMES = [
     "GadgetGear ID", "TechPro VN", "GameStore PH", "PhoneGear TH",
 ]
 
-# Build merchant list: M001-M008 are problem merchants, rest are normal
-merchants = []
-for i in range(1, 61):
-    mid = f"M{i:03d}"
-    name = MERCHANT_NAMES[i - 1]
-    cat = random.choice(MERCHANT_CATEGORIES)
-    merchants.append({"merchant_id": mid, "merchant_name": name, "merchant_category": cat})
+# Merchant catalogue as parallel arrays (M001-M008 are problem merchants,
+# rest are normal) so records can gather all three fields by index.
+MERCH_ID_ARR = np.array([f"M{i:03d}" for i in range(1, 61)], dtype=object)
+MERCH_NAME_ARR = np.array(MERCHANT_NAMES, dtype=object)
+MERCH_CAT_ARR = rng.choice(np.array(MERCHANT_CATEGORIES, dtype=object), size=60)
 
 # --- Record generation ---
 TOTAL_RECORDS = 910  # aim for 900+
@@ -85,47 +77,59 @@ oldest_count = int(TOTAL_RECORDS * 0.15)   # ~137
 middle_count = int(TOTAL_RECORDS * 0.30)   # ~273
 recent_count = TOTAL_RECORDS - oldest_count - middle_count  # ~500
 
-records = []
-
-def make_records(n: int, d_start: date, d_end: date):
-    for _ in range(n):
-        reason_cat = random.choices(REASON_CATEGORIES, weights=REASON_WEIGHTS)[0]
-        reason_code = random.choice(REASON_CODE_MAP[reason_cat])
-        payment = random.choices(PAYMENT_METHODS, weights=PAYMENT_WEIGHTS)[0]
-        country = random.choices(COUNTRIES, weights=COUNTRY_WEIGHTS)[0]
-
-        # Pick merchant: problem merchants (M001-M008) get higher probability
-        # We'll assign during post-processing; here just pick randomly weighted
-        roll = random.random()
-        if roll < 0.72:  # 72% of records go to problem merchants M001-M008
-            merch = merchants[random.randint(0, 7)]
-        else:
-            merch = merchants[random.randint(8, 59)]
-
-        amount = float(np.clip(np.random.lognormal(mean=3.5, sigma=0.9), 8, 450))
-        amount = round(amount, 2)
-
-        status = random.choices(["open", "won", "lost"], weights=[0.45, 0.25, 0.30])[0]
-
-        records.append({
-            "chargeback_id": str(uuid.uuid4()),
-            "date": random_date_in_range(d_start, d_end).isoformat(),
-            "merchant_id": merch["merchant_id"],
-            "merchant_name": merch["merchant_name"],
-            "merchant_category": merch["merchant_category"],
-            "country": country,
-            "reason_category": reason_cat,
-            "reason_code": reason_code,
-            "payment_method": payment,
-            "amount_usd": amount,
-            "status": status,
-        })
-
-make_records(oldest_count, start_date, oldest_end)
-make_records(middle_count, middle_start, middle_end)
-make_records(recent_count, recent_start, today)
-
-df = pd.DataFrame(records)
+def make_records(n: int, d_start: date, d_end: date) -> pd.DataFrame:
+    """Draw all n records for one period as columnar arrays in bulk -
+    no per-record Python sampling calls."""
+    reason_idx = rng.choice(len(REASON_CATEGORIES), size=n, p=REASON_WEIGHTS)
+    reason_cat = np.take(np.array(REASON_CATEGORIES, dtype=object), reason_idx)
+
+    # Reason code: uniform pick within each category's code list
+    reason_code = np.empty(n, dtype=object)
+    for cat, codes in REASON_CODE_MAP.items():
+        m = reason_cat == cat
+        reason_code[m] = np.take(np.array(codes, dtype=object),
+                                 rng.integers(0, len(codes), size=int(m.sum())))
+
+    payment = np.take(np.array(PAYMENT_METHODS, dtype=object),
+                      rng.choice(len(PAYMENT_METHODS), size=n, p=PAYMENT_WEIGHTS))
+    country = np.take(np.array(COUNTRIES, dtype=object),
+                      rng.choice(len(COUNTRIES), size=n, p=COUNTRY_WEIGHTS))
+
+    # 72% of records go to problem merchants M001-M008
+    m_idx = np.where(rng.random(n) < 0.72,
+                     rng.integers(0, 8, size=n),
+                     rng.integers(8, 60, size=n))
+
+    amount = rng.lognormal(mean=3.5, sigma=0.9, size=n).clip(8, 450).round(2)
+
+    status = np.take(np.array(["open", "won", "lost"], dtype=object),
+                     rng.choice(3, size=n, p=[0.45, 0.25, 0.30]))
+
+    delta = (d_end - d_start).days
+    dates = np.datetime64(d_start) + rng.integers(0, delta + 1, size=n).astype("timedelta64[D]")
+
+    return pd.DataFrame({
+        "chargeback_id": [str(uuid.uuid4()) for _ in range(n)],
+        "date": np.datetime_as_string(dates, unit="D"),
+        "merchant_id": MERCH_ID_ARR[m_idx],
+        "merchant_name": MERCH_NAME_ARR[m_idx],
+        "merchant_category": MERCH_CAT_ARR[m_idx],
+        "country": country,
+        "reason_category": reason_cat,
+        "reason_code": reason_code,
+        "payment_method": payment,
+        "amount_usd": amount,
+        "status": status,
+    })
+
+df = pd.concat(
+    [
+        make_records(oldest_count, start_date, oldest_end),
+        make_records(middle_count, middle_start, middle_end),
+        make_records(recent_count, recent_start, today),
+    ],
+    ignore_index=True,
+)
 output_path = "chargebacks.csv"
 df.to_csv(output_path, index=False)
 print(f"Generated {len(df)} records → {output_path}")
@@ -11,16 +11,61 @@ Proven facts about the seeded dataset (SEED=42, 1 000 chargeback rows):
 
 Run from the project root:
     pytest tests/ -q
+
+The tests only read from the server, so they parallelize cleanly with
+pytest-xdist when installed:
+    pytest tests/ -q -n 4
 """
 
 from __future__ import annotations
 
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
 
+import orjson
+import pyarrow as pa
 import pytest
-import requests
 
-BASE = "http://localhost:8000"
+# M001-M008 are seeded with elevated chargeback rates; built once at import.
+PROBLEM_MERCHANTS = frozenset(f"M{i:03d}" for i in range(1, 9))
+
+
+# Client handle for _cached_get: lru_cache needs hashable arguments, so the
+# (unhashable-by-design) client travels through a module global that jget
+# refreshes on every call.
+_http = None
+
+
+@lru_cache(maxsize=256)
+def _cached_get(path, params_key):
+    return orjson.loads(_http.get(path, params=dict(params_key)).content)
+
+
+def jget(http, path, params=None):
+    """GET a path and decode the body with orjson (2-3x faster than the
+    stdlib decoder, which adds up on the /api/metrics payload). Responses
+    are memoized per (path, params), so identical requests issued from
+    different classes hit the server once per run."""
+    global _http
+    _http = http
+    return _cached_get(path, tuple(sorted((params or {}).items())))
+
+
+def _is_sorted(xs, reverse=False):
+    """Single-pass sortedness check: no sorted() copy, short-circuits on the
+    first out-of-order pair."""
+    op = operator.ge if reverse else operator.le
+    return all(op(a, b) for a, b in zip(xs, xs[1:]))
+
+
+def parallel_get(http, calls):
+    """Fire independent GETs concurrently on the pooled session; returns the
+    parsed JSON bodies in call order. Wall time becomes max(latencies)
+    instead of their sum."""
+    with ThreadPoolExecutor(max_workers=len(calls)) as ex:
+        return list(ex.map(lambda c: jget(http, c[0], params=c[1]), calls))
 
 # ── fixed date anchors (derived from SEED=42 90-day window) ──────────────────
 TODAY = date.today()
@@ -28,22 +73,29 @@ START = TODAY - timedelta(days=89)           # oldest date in dataset
 OLDEST_7_END = START + timedelta(days=6)     # 7-day slice at oldest end
 LAST_10_START = TODAY - timedelta(days=9)    # fraud-spike window for M003
 
+# ISO strings formatted once at import; these are what goes on the wire.
+DATE_TODAY = TODAY.isoformat()
+DATE_30D_START = (TODAY - timedelta(days=29)).isoformat()
+DATE_START = START.isoformat()
+DATE_OLDEST_7_END = OLDEST_7_END.isoformat()
+DATE_LAST_10_START = LAST_10_START.isoformat()
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 1. HTTP status codes
 # ═══════════════════════════════════════════════════════════════════════════
 
 class TestStatusCodes:
-    def test_health_200(self):
-        r = requests.get(f"{BASE}/api/health")
+    def test_health_200(self, http):
+        r = http.get("/api/health")
         assert r.status_code == 200
 
-    def test_metrics_200(self):
-        r = requests.get(f"{BASE}/api/metrics")
+    def test_metrics_200(self, http):
+        r = http.get("/api/metrics")
         assert r.status_code == 200, r.text
 
-    def test_chargebacks_200(self):
-        r = requests.get(f"{BASE}/api/chargebacks")
+    def test_chargebacks_200(self, http):
+        r = http.get("/api/chargebacks")
         assert r.status_code == 200, r.text
 
 
@@ -52,8 +104,8 @@ class TestStatusCodes:
 # ═══════════════════════════════════════════════════════════════════════════
 
 class TestResponseStructure:
-    def test_metrics_required_keys(self):
-        data = requests.get(f"{BASE}/api/metrics").json()
+    def test_metrics_required_keys(self, metrics_all):
+        data = metrics_all
         required = {
             "total_chargebacks", "total_disputed_amount",
             "chargeback_rate", "trend_pct",
@@ -63,8 +115,8 @@ class TestResponseStructure:
         missing = required - data.keys()
         assert not missing, f"Missing keys in /api/metrics: {missing}"
 
-    def test_metrics_value_types(self):
-        data = requests.get(f"{BASE}/api/metrics").json()
+    def test_metrics_value_types(self, metrics_all):
+        data = metrics_all
         assert isinstance(data["total_chargebacks"], int)
         assert isinstance(data["total_disputed_amount"], float)
         assert isinstance(data["chargeback_rate"], float)
@@ -72,25 +124,22 @@ class TestResponseStructure:
         assert isinstance(data["by_category"], list)
         assert isinstance(data["top_merchants"], list)
 
-    def test_chargebacks_required_keys(self):
-        data = requests.get(f"{BASE}/api/chargebacks").json()
+    def test_chargebacks_required_keys(self, cb_all):
         for key in ("records", "total", "page", "page_size"):
-            assert key in data, f"Missing key '{key}' in /api/chargebacks"
+            assert key in cb_all, f"Missing key '{key}' in /api/chargebacks"
 
-    def test_chargebacks_records_are_list(self):
-        data = requests.get(f"{BASE}/api/chargebacks").json()
-        assert isinstance(data["records"], list)
-        assert len(data["records"]) > 0
+    def test_chargebacks_records_are_list(self, cb_all):
+        assert isinstance(cb_all["records"], list)
+        assert len(cb_all["records"]) > 0
 
-    def test_chargebacks_record_columns(self):
-        data = requests.get(f"{BASE}/api/chargebacks", params={"page_size": 1}).json()
-        rec = data["records"][0]
+    def test_chargebacks_record_columns(self, cb_all):
+        rec = cb_all["records"][0]
         for col in ("chargeback_id", "merchant_id", "merchant_name",
                     "country", "reason_category", "payment_method", "amount_usd"):
             assert col in rec, f"Column '{col}' missing from chargeback record"
 
-    def test_top_merchants_shape(self):
-        data = requests.get(f"{BASE}/api/metrics").json()
+    def test_top_merchants_shape(self, metrics_all):
+        data = metrics_all
         assert len(data["top_merchants"]) > 0
         m = data["top_merchants"][0]
         for key in ("merchant_id", "merchant_name", "count", "amount", "rate"):
@@ -102,53 +151,28 @@ class TestResponseStructure:
 # ═══════════════════════════════════════════════════════════════════════════
 
 class TestFiltersChangeOutputs:
-    @pytest.fixture(scope="class")
-    def total_all(self):
-        return requests.get(f"{BASE}/api/metrics").json()["total_chargebacks"]
-
-    def test_filter_date_range(self, total_all):
-        start = (TODAY - timedelta(days=29)).isoformat()
-        end   = TODAY.isoformat()
-        n = requests.get(f"{BASE}/api/metrics",
-                         params={"start_date": start, "end_date": end}
-                         ).json()["total_chargebacks"]
+    @pytest.mark.parametrize("params", [
+        {"start_date": DATE_30D_START, "end_date": DATE_TODAY},
+        {"merchant_id": "M001"},
+        {"reason_category": "fraud"},
+        {"payment_method": "visa"},
+        {"country": "ID"},
+        {"min_amount": 50, "max_amount": 150},
+    ])
+    def test_filter_reduces_count(self, http, total_all, params):
+        n = jget(http, "/api/metrics", params=params)["total_chargebacks"]
         assert 0 < n < total_all, (
-            f"Date-range filter should reduce count: {n} vs {total_all}"
+            f"Filter {params} should reduce count: {n} vs {total_all}"
         )
 
-    def test_filter_merchant_id(self, total_all):
-        n = requests.get(f"{BASE}/api/metrics",
-                         params={"merchant_id": "M001"}).json()["total_chargebacks"]
-        assert 0 < n < total_all
-
-    def test_filter_reason_category(self, total_all):
-        n = requests.get(f"{BASE}/api/metrics",
-                         params={"reason_category": "fraud"}).json()["total_chargebacks"]
-        assert 0 < n < total_all
-
-    def test_filter_payment_method(self, total_all):
-        n = requests.get(f"{BASE}/api/metrics",
-                         params={"payment_method": "visa"}).json()["total_chargebacks"]
-        assert 0 < n < total_all
-
-    def test_filter_country(self, total_all):
-        n = requests.get(f"{BASE}/api/metrics",
-                         params={"country": "ID"}).json()["total_chargebacks"]
-        assert 0 < n < total_all
-
-    def test_filter_amount_range(self, total_all):
-        n = requests.get(f"{BASE}/api/metrics",
-                         params={"min_amount": 50, "max_amount": 150}
-                         ).json()["total_chargebacks"]
-        assert 0 < n < total_all
-
-    def test_combined_filters_further_reduce_count(self, total_all):
-        single = requests.get(f"{BASE}/api/metrics",
-                               params={"country": "ID"}).json()["total_chargebacks"]
-        combo  = requests.get(f"{BASE}/api/metrics",
-                               params={"country": "ID",
-                                       "payment_method": "visa"}
-                               ).json()["total_chargebacks"]
+    def test_combined_filters_further_reduce_count(self, http, total_all):
+        single, combo = (
+            r["total_chargebacks"]
+            for r in parallel_get(http, [
+                ("/api/metrics", {"country": "ID"}),
+                ("/api/metrics", {"country": "ID", "payment_method": "visa"}),
+            ])
+        )
         assert 0 < combo <= single, (
             "Adding a second filter should not increase count"
         )
@@ -160,10 +184,6 @@ class TestFiltersChangeOutputs:
 # ═══════════════════════════════════════════════════════════════════════════
 
 class TestChargebackRate:
-    @pytest.fixture(scope="class")
-    def rate_all(self):
-        return requests.get(f"{BASE}/api/metrics").json()["chargeback_rate"]
-
     def test_overall_rate_not_zero(self, rate_all):
         assert rate_all > 0
 
@@ -179,11 +199,10 @@ class TestChargebackRate:
 
     # ── merchant_id filter ────────────────────────────────────────────────
 
-    def test_rate_changes_with_problem_merchant_filter(self, rate_all):
+    def test_rate_changes_with_problem_merchant_filter(self, http, rate_all):
         """Problem merchant (M001 ~11%) should have a higher rate than overall (~5.3%)."""
-        rate_m001 = requests.get(f"{BASE}/api/metrics",
-                                  params={"merchant_id": "M001"}
-                                  ).json()["chargeback_rate"]
+        rate_m001 = jget(http, "/api/metrics",
+                         params={"merchant_id": "M001"})["chargeback_rate"]
         assert rate_m001 != rate_all, (
             f"Problem merchant rate ({rate_m001}%) should differ from overall ({rate_all}%)"
         )
@@ -191,11 +210,10 @@ class TestChargebackRate:
             f"Problem merchant (M001) rate {rate_m001}% should exceed overall {rate_all}%"
         )
 
-    def test_rate_changes_with_normal_merchant_filter(self, rate_all):
+    def test_rate_changes_with_normal_merchant_filter(self, http, rate_all):
         """Normal merchant (M034 ~2.6%) should have a lower rate than overall (~5.3%)."""
-        rate_m034 = requests.get(f"{BASE}/api/metrics",
-                                  params={"merchant_id": "M034"}
-                                  ).json()["chargeback_rate"]
+        rate_m034 = jget(http, "/api/metrics",
+                         params={"merchant_id": "M034"})["chargeback_rate"]
         assert rate_m034 != rate_all, (
             f"Normal merchant rate ({rate_m034}%) should differ from overall ({rate_all}%)"
         )
@@ -203,24 +221,30 @@ class TestChargebackRate:
             f"Normal merchant (M034) rate {rate_m034}% should be below overall {rate_all}%"
         )
 
-    def test_problem_merchant_rate_exceeds_normal_merchant_rate(self):
+    def test_problem_merchant_rate_exceeds_normal_merchant_rate(self, http):
         """Structural invariant: problem merchants always have higher rates than normal ones."""
-        r_problem = requests.get(f"{BASE}/api/metrics",
-                                  params={"merchant_id": "M002"}).json()["chargeback_rate"]
-        r_normal  = requests.get(f"{BASE}/api/metrics",
-                                  params={"merchant_id": "M020"}).json()["chargeback_rate"]
+        r_problem, r_normal = (
+            r["chargeback_rate"]
+            for r in parallel_get(http, [
+                ("/api/metrics", {"merchant_id": "M002"}),
+                ("/api/metrics", {"merchant_id": "M020"}),
+            ])
+        )
         assert r_problem > r_normal, (
             f"Problem M002 ({r_problem}%) should exceed normal M020 ({r_normal}%)"
         )
 
     # ── country filter ────────────────────────────────────────────────────
 
-    def test_rate_changes_with_country_filter(self, rate_all):
+    def test_rate_changes_with_country_filter(self, http, rate_all):
         """ID rate (~5.24%) and VN rate (~5.97%) both differ from overall (~5.33%)."""
-        rate_id = requests.get(f"{BASE}/api/metrics",
-                                params={"country": "ID"}).json()["chargeback_rate"]
-        rate_vn = requests.get(f"{BASE}/api/metrics",
-                                params={"country": "VN"}).json()["chargeback_rate"]
+        rate_id, rate_vn = (
+            r["chargeback_rate"]
+            for r in parallel_get(http, [
+                ("/api/metrics", {"country": "ID"}),
+                ("/api/metrics", {"country": "VN"}),
+            ])
+        )
         assert rate_id != rate_all, (
             f"country=ID rate ({rate_id}%) should differ from unfiltered ({rate_all}%)"
         )
@@ -234,64 +258,58 @@ class TestChargebackRate:
 
     # ── date range filter ─────────────────────────────────────────────────
 
-    def test_rate_changes_with_narrow_date_window(self, rate_all):
+    def test_rate_changes_with_narrow_date_window(self, http, rate_all):
         """
         Oldest 7-day window has a different merchant mix → different implied rate.
         Expected ~5.94 % vs overall ~5.33 %.
         """
-        rate_7d = requests.get(
-            f"{BASE}/api/metrics",
-            params={
-                "start_date": START.isoformat(),
-                "end_date":   OLDEST_7_END.isoformat(),
-            },
-        ).json()["chargeback_rate"]
+        rate_7d = jget(http, "/api/metrics", params={
+            "start_date": DATE_START,
+            "end_date":   DATE_OLDEST_7_END,
+        })["chargeback_rate"]
         assert rate_7d != rate_all, (
             f"Narrow date window rate ({rate_7d}%) should differ from 90-day rate ({rate_all}%)"
         )
 
-    def test_rate_changes_with_last_10_days(self, rate_all):
+    def test_rate_changes_with_last_10_days(self, http, rate_all):
         """
         Last-10-day window includes M003 fraud spike → elevated rate.
         Expected ~5.71 % vs overall ~5.33 %.
         """
-        rate_10d = requests.get(
-            f"{BASE}/api/metrics",
-            params={
-                "start_date": LAST_10_START.isoformat(),
-                "end_date":   TODAY.isoformat(),
-            },
-        ).json()["chargeback_rate"]
+        rate_10d = jget(http, "/api/metrics", params={
+            "start_date": DATE_LAST_10_START,
+            "end_date":   DATE_TODAY,
+        })["chargeback_rate"]
         assert rate_10d != rate_all, (
             f"Last-10-day rate ({rate_10d}%) should differ from 90-day rate ({rate_all}%)"
         )
 
     # ── per-merchant rates in top_merchants ───────────────────────────────
 
-    def test_top_merchants_rates_vary(self):
+    def test_top_merchants_rates_vary(self, metrics_all):
         """
         Top-merchants list should show heterogeneous rates
         (not all identical), proving per-merchant rate is wired up.
         """
-        merchants = requests.get(f"{BASE}/api/metrics").json()["top_merchants"]
+        merchants = metrics_all["top_merchants"]
         rates = [m["rate"] for m in merchants]
         assert len(set(rates)) > 1, (
             f"All top-merchant rates are identical ({rates[0]}%); "
             "per-merchant rate computation is not varying."
         )
 
-    def test_top_merchants_problem_rates_above_normal(self):
+    def test_top_merchants_problem_rates_above_normal(self, metrics_all):
         """
         Among the top 10 merchants, the first 8 slots should be dominated
         by problem merchants (M001-M008) and their rates should be above 8%.
         """
-        merchants = requests.get(f"{BASE}/api/metrics").json()["top_merchants"]
-        problem_rates = [m["rate"] for m in merchants
-                         if m["merchant_id"] in {f"M{i:03d}" for i in range(1, 9)}]
-        assert problem_rates, "No problem merchants in top-10"
-        assert all(r > 8 for r in problem_rates), (
-            f"Problem merchant rates should all exceed 8%, got {problem_rates}"
+        merchants = metrics_all["top_merchants"]
+        assert any(m["merchant_id"] in PROBLEM_MERCHANTS for m in merchants), (
+            "No problem merchants in top-10"
         )
+        bad = [(m["merchant_id"], m["rate"]) for m in merchants
+               if m["merchant_id"] in PROBLEM_MERCHANTS and m["rate"] <= 8]
+        assert not bad, f"Problem merchant rates should all exceed 8%, got {bad}"
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -299,84 +317,88 @@ class TestChargebackRate:
 # ═══════════════════════════════════════════════════════════════════════════
 
 class TestChargebacksPaginationSorting:
-    def test_pagination_returns_correct_page_meta(self):
-        r1 = requests.get(f"{BASE}/api/chargebacks",
-                           params={"page": 1, "page_size": 10}).json()
-        r2 = requests.get(f"{BASE}/api/chargebacks",
-                           params={"page": 2, "page_size": 10}).json()
+    def test_pagination_invariants(self, http):
+        """One parallel fetch of pages 1 and 2 checks page meta, record
+        counts, non-overlap, and total consistency in a single pass."""
+        r1, r2 = parallel_get(http, [
+            ("/api/chargebacks", {"page": 1, "page_size": 20}),
+            ("/api/chargebacks", {"page": 2, "page_size": 20}),
+        ])
         assert r1["page"] == 1
         assert r2["page"] == 2
-        assert len(r1["records"]) == 10
-        assert len(r2["records"]) == 10
-
-    def test_pages_have_non_overlapping_records(self):
-        r1 = requests.get(f"{BASE}/api/chargebacks",
-                           params={"page": 1, "page_size": 20}).json()
-        r2 = requests.get(f"{BASE}/api/chargebacks",
-                           params={"page": 2, "page_size": 20}).json()
+        assert len(r1["records"]) == 20
+        assert len(r2["records"]) == 20
         ids1 = {rec["chargeback_id"] for rec in r1["records"]}
         ids2 = {rec["chargeback_id"] for rec in r2["records"]}
         assert ids1.isdisjoint(ids2), "Page 1 and page 2 share records"
-
-    def test_total_is_consistent_across_pages(self):
-        r1 = requests.get(f"{BASE}/api/chargebacks",
-                           params={"page": 1, "page_size": 50}).json()
-        r2 = requests.get(f"{BASE}/api/chargebacks",
-                           params={"page": 2, "page_size": 50}).json()
         assert r1["total"] == r2["total"], (
             f"Total differs across pages: {r1['total']} vs {r2['total']}"
         )
 
-    def test_sort_date_ascending(self):
-        data = requests.get(f"{BASE}/api/chargebacks",
-                             params={"sort_by": "date", "sort_dir": "asc",
-                                     "page_size": 20}).json()
+    def test_sort_date_ascending(self, http):
+        data = jget(http, "/api/chargebacks",
+                    params={"sort_by": "date", "sort_dir": "asc",
+                            "page_size": 20})
         dates = [rec["date"] for rec in data["records"]]
-        assert dates == sorted(dates), f"Dates are not ascending: {dates[:5]}"
+        assert _is_sorted(dates), f"Dates are not ascending: {dates[:5]}"
 
-    def test_sort_date_descending(self):
-        data = requests.get(f"{BASE}/api/chargebacks",
-                             params={"sort_by": "date", "sort_dir": "desc",
-                                     "page_size": 20}).json()
+    def test_sort_date_descending(self, http):
+        data = jget(http, "/api/chargebacks",
+                    params={"sort_by": "date", "sort_dir": "desc",
+                            "page_size": 20})
         dates = [rec["date"] for rec in data["records"]]
-        assert dates == sorted(dates, reverse=True), (
+        assert _is_sorted(dates, reverse=True), (
             f"Dates are not descending: {dates[:5]}"
         )
 
-    def test_sort_asc_desc_first_records_differ(self):
-        asc  = requests.get(f"{BASE}/api/chargebacks",
-                             params={"sort_by": "date", "sort_dir": "asc",
-                                     "page_size": 1}).json()
-        desc = requests.get(f"{BASE}/api/chargebacks",
-                             params={"sort_by": "date", "sort_dir": "desc",
-                                     "page_size": 1}).json()
+    def test_sort_asc_desc_first_records_differ(self, http):
+        asc, desc = parallel_get(http, [
+            ("/api/chargebacks", {"sort_by": "date", "sort_dir": "asc",
+                                  "page_size": 1}),
+            ("/api/chargebacks", {"sort_by": "date", "sort_dir": "desc",
+                                  "page_size": 1}),
+        ])
         assert asc["records"][0]["chargeback_id"] != desc["records"][0]["chargeback_id"], (
             "First record with asc and desc sort should be different"
         )
 
-    def test_sort_by_amount_descending(self):
-        data = requests.get(f"{BASE}/api/chargebacks",
-                             params={"sort_by": "amount_usd", "sort_dir": "desc",
-                                     "page_size": 10}).json()
+    def test_sort_by_amount_descending(self, http):
+        data = jget(http, "/api/chargebacks",
+                    params={"sort_by": "amount_usd", "sort_dir": "desc",
+                            "page_size": 10})
         amounts = [rec["amount_usd"] for rec in data["records"]]
-        assert amounts == sorted(amounts, reverse=True), (
+        assert _is_sorted(amounts, reverse=True), (
             f"Amounts not descending: {amounts}"
         )
 
-    def test_sort_by_processor(self):
+    def test_sort_by_payment_method_alphabetical(self, http, metrics_all):
+        """Categorical columns must sort by label, not internal code order
+        (regression: the Parquet load path carries generator-declared
+        category order, which put visa before bank_transfer)."""
+        data = jget(http, "/api/chargebacks",
+                    params={"sort_by": "payment_method", "sort_dir": "asc",
+                            "page_size": 10})
+        methods = [rec["payment_method"] for rec in data["records"]]
+        assert _is_sorted(methods), f"Payment methods not ascending: {methods}"
+        first = min(row["payment_method"] for row in metrics_all["by_payment_method"])
+        assert methods[0] == first, (
+            f"Ascending sort should start at {first!r}, got {methods[0]!r}"
+        )
+
+    def test_sort_by_processor(self, http):
         """Sorting by processor should not raise an error (regression: status was broken)."""
-        r = requests.get(f"{BASE}/api/chargebacks",
-                          params={"sort_by": "processor", "sort_dir": "asc",
-                                  "page_size": 5})
+        r = http.get("/api/chargebacks",
+                     params={"sort_by": "processor", "sort_dir": "asc",
+                             "page_size": 5})
         assert r.status_code == 200
 
-    def test_last_page_is_partial(self):
-        """The last page should have fewer records than page_size."""
-        total = requests.get(f"{BASE}/api/chargebacks").json()["total"]
+    def test_last_page_is_partial(self, http, cb_all):
+        """The last page should have no more records than page_size."""
+        total = cb_all["total"]
         page_size = 50
-        last_page = (total // page_size) + 1
-        data = requests.get(f"{BASE}/api/chargebacks",
-                             params={"page": last_page, "page_size": page_size}).json()
+        last_page = -(-total // page_size)   # ceil division
+        data = jget(http, "/api/chargebacks",
+                    params={"page": last_page, "page_size": page_size})
         expected_size = total % page_size or page_size
         assert len(data["records"]) == expected_size, (
             f"Last page: expected {expected_size} records, got {len(data['records'])}"
@@ -387,32 +409,85 @@ class TestChargebacksPaginationSorting:
 # 6. Filter consistency between /api/metrics and /api/chargebacks
 # ═══════════════════════════════════════════════════════════════════════════
 
+CONSISTENCY_PARAMS = [
+    {"country": "ID"},
+    {"payment_method": "visa"},
+    {"reason_category": "fraud"},
+    {"merchant_id": "M003"},
+    {"country": "PH", "payment_method": "gopay"},
+]
+
+
+def _pkey(params):
+    return tuple(sorted(params.items()))
+
+
 class TestFilterConsistency:
-    @pytest.mark.parametrize("params", [
-        {"country": "ID"},
-        {"payment_method": "visa"},
-        {"reason_category": "fraud"},
-        {"merchant_id": "M003"},
-        {"country": "PH", "payment_method": "gopay"},
-    ])
-    def test_metrics_and_chargebacks_agree_on_count(self, params):
-        metrics = requests.get(f"{BASE}/api/metrics", params=params).json()
-        cb_resp = requests.get(f"{BASE}/api/chargebacks",
-                                params={**params, "page_size": 1}).json()
+    @pytest.fixture(scope="session")
+    def consistency_pairs(self, http):
+        """All ten metrics/chargebacks responses fetched in one parallel
+        batch; the parametrized cases below reduce to in-memory asserts."""
+        calls = [("/api/metrics", p) for p in CONSISTENCY_PARAMS]
+        calls += [("/api/chargebacks", {**p, "page_size": 1})
+                  for p in CONSISTENCY_PARAMS]
+        bodies = parallel_get(http, calls)
+        n = len(CONSISTENCY_PARAMS)
+        return {_pkey(p): (bodies[i], bodies[n + i])
+                for i, p in enumerate(CONSISTENCY_PARAMS)}
+
+    @pytest.mark.parametrize("params", CONSISTENCY_PARAMS)
+    def test_metrics_and_chargebacks_agree_on_count(self, consistency_pairs, params):
+        metrics, cb_resp = consistency_pairs[_pkey(params)]
         assert metrics["total_chargebacks"] == cb_resp["total"], (
             f"Count mismatch for {params}: "
             f"metrics={metrics['total_chargebacks']}, chargebacks={cb_resp['total']}"
         )
 
-    def test_empty_filter_returns_all(self):
-        metrics = requests.get(f"{BASE}/api/metrics").json()
-        cb_resp = requests.get(f"{BASE}/api/chargebacks",
-                                params={"page_size": 1}).json()
-        assert metrics["total_chargebacks"] == cb_resp["total"]
+    def test_empty_filter_returns_all(self, metrics_all, cb_all):
+        assert metrics_all["total_chargebacks"] == cb_all["total"]
 
-    def test_impossibly_narrow_amount_returns_zero(self):
-        metrics = requests.get(f"{BASE}/api/metrics",
-                                params={"min_amount": 999, "max_amount": 1000}
-                                ).json()
+    def test_impossibly_narrow_amount_returns_zero(self, http):
+        metrics = jget(http, "/api/metrics",
+                       params={"min_amount": 999, "max_amount": 1000})
         assert metrics["total_chargebacks"] == 0
         assert metrics["chargeback_rate"] == 0.0
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 7. Arrow IPC twins of the JSON endpoints
+# ═══════════════════════════════════════════════════════════════════════════
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _arrow_meta(table):
+    """Scalar metrics ride JSON-encoded in the IPC schema metadata."""
+    return {k.decode(): orjson.loads(v) for k, v in table.schema.metadata.items()}
+
+
+class TestArrowEndpoints:
+    def test_chargebacks_arrow_matches_json(self, http, cb_all):
+        r = http.get("/api/chargebacks.arrow", params={"page_size": 1})
+        assert r.status_code == 200
+        assert r.headers["content-type"] == ARROW_MEDIA_TYPE
+        table = pa.ipc.open_stream(r.content).read_all()
+        assert table.num_rows == 1
+        assert "chargeback_id" in table.column_names
+        meta = _arrow_meta(table)
+        assert meta["total"] == cb_all["total"]
+        assert meta["page"] == 1
+        assert meta["page_size"] == 1
+
+    def test_metrics_arrow_matches_json(self, http, metrics_all):
+        r = http.get("/api/metrics.arrow")
+        assert r.status_code == 200
+        assert r.headers["content-type"] == ARROW_MEDIA_TYPE
+        table = pa.ipc.open_stream(r.content).read_all()
+        meta = _arrow_meta(table)
+        assert meta["total_chargebacks"] == metrics_all["total_chargebacks"]
+        assert meta["chargeback_rate"] == metrics_all["chargeback_rate"]
+        # One tidy row per breakdown entry across all six components.
+        components = ("by_category", "by_country", "by_payment_method",
+                      "by_processor", "by_day", "top_merchants")
+        assert set(table.column("component").to_pylist()) == set(components)
+        assert table.num_rows == sum(len(metrics_all[c]) for c in components)